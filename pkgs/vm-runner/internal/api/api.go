@@ -5,8 +5,9 @@ import (
 	"encoding/json"
 	"fmt"
 	"io"
-	"math/rand"
+	"math/rand/v2"
 	"net/http"
+	"strings"
 	"time"
 )
 
@@ -85,7 +86,7 @@ func (c *APIClient) callAPI(endpoint string, method string, data Data) (Data, er
 				return nil, err
 			}
 
-			jitter := time.Duration(rand.Int63n(int64(100 * time.Millisecond)))
+			jitter := time.Duration(rand.Int64N(int64(100 * time.Millisecond)))
 			time.Sleep(100*time.Millisecond*time.Duration(1<<attempt) + jitter)
 			continue
 		}
@@ -95,6 +96,12 @@ func (c *APIClient) callAPI(endpoint string, method string, data Data) (Data, er
 			return nil, fmt.Errorf("request failed with status %d", resp.StatusCode)
 		}
 
+		// krunkit does not reliably set Content-Type, so only skip decoding
+		// when the response explicitly reports a non-JSON body.
+		if ct := resp.Header.Get("Content-Type"); ct != "" && !strings.Contains(ct, "json") {
+			return nil, nil
+		}
+
 		respBody, err := io.ReadAll(resp.Body)
 		if err != nil || len(respBody) == 0 {
 			return nil, nil
@@ -115,7 +122,6 @@ func (c *APIClient) callAPI(endpoint string, method string, data Data) (Data, er
 
 func (c *APIClient) Close() {
 	c.client.CloseIdleConnections()
-	c.client = nil
 }
 
 func (c *APIClient) Get(endpoint string) (Data, error) {
@@ -42,9 +42,11 @@ func (c *CircuitBreaker) Call(fn func() error) error {
 	}
 
 	if err := fn(); err != nil {
-		c.lastFailureTime = time.Now()
 		c.failureCount++
 		if c.failureCount >= c.failureThreshold {
+			// The timestamp is only consulted while the breaker is open, so
+			// read the clock only when tripping (or re-tripping) it.
+			c.lastFailureTime = time.Now()
 			c.state = CircuitStateOpen
 		}
 		return err
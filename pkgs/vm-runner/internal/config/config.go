@@ -38,6 +38,35 @@ type VMConfig struct {
 	WorkingDirectory     string
 }
 
+func statPath(path string) (os.FileInfo, error) {
+	info, err := os.Stat(path)
+	if err != nil {
+		if os.IsNotExist(err) {
+			return nil, fmt.Errorf("path not found: %s", path)
+		}
+		return nil, fmt.Errorf("could not access path: %w", err)
+	}
+
+	return info, nil
+}
+
+func resolveDir(path string) (string, error) {
+	info, err := statPath(path)
+	if err != nil {
+		return "", err
+	}
+	if !info.IsDir() {
+		return "", fmt.Errorf("path is not a directory: %s", path)
+	}
+
+	absPath, err := filepath.Abs(path)
+	if err != nil {
+		return "", fmt.Errorf("could not resolve path %s: %w", path, err)
+	}
+
+	return absPath, nil
+}
+
 func NewVMConfig(configFilePath string) (*VMConfig, error) {
 	f, err := os.Open(configFilePath)
 	if err != nil {
@@ -60,41 +89,24 @@ func NewVMConfig(configFilePath string) (*VMConfig, error) {
 		return nil, fmt.Errorf("invalid value for 'port': %v", raw.Port)
 	}
 
-	if _, err := os.Stat(raw.DriverBin); err != nil {
-		if os.IsNotExist(err) {
-			return nil, fmt.Errorf("path not found: %s", raw.DriverBin)
-		}
-		return nil, fmt.Errorf("could not access path: %w", err)
+	if _, err := statPath(raw.DriverBin); err != nil {
+		return nil, err
 	}
 
 	resolvedSharedDirs := make(map[string]string)
 
 	for tag, path := range raw.SharedDirs {
-		info, err := os.Stat(path)
-		if err != nil {
-			if os.IsNotExist(err) {
-				return nil, fmt.Errorf("path not found: %s", path)
-			}
-			return nil, fmt.Errorf("could not access path: %w", err)
-		}
-		if !info.IsDir() {
-			return nil, fmt.Errorf("path is not a directory: %s", path)
-		}
-
-		absPath, err := filepath.Abs(path)
+		absPath, err := resolveDir(path)
 		if err != nil {
-			return nil, fmt.Errorf("could not resolve path %s: %w", path, err)
+			return nil, err
 		}
 
 		resolvedSharedDirs[tag] = absPath
 	}
 
 	if raw.Driver == DriverKrunkit {
-		if _, err := os.Stat(raw.VMNetHelperBin); err != nil {
-			if os.IsNotExist(err) {
-				return nil, fmt.Errorf("path not found: %s", raw.VMNetHelperBin)
-			}
-			return nil, fmt.Errorf("could not access path: %w", err)
+		if _, err := statPath(raw.VMNetHelperBin); err != nil {
+			return nil, err
 		}
 	}
 
@@ -103,20 +115,9 @@ func NewVMConfig(configFilePath string) (*VMConfig, error) {
 		workingDirectory = WorkingDirectoryDefault
 	}
 
-	info, err := os.Stat(workingDirectory)
-	if err != nil {
-		if os.IsNotExist(err) {
-			return nil, fmt.Errorf("path not found: %s", workingDirectory)
-		}
-		return nil, fmt.Errorf("could not access path: %w", err)
-	}
-	if !info.IsDir() {
-		return nil, fmt.Errorf("path is not a directory: %s", workingDirectory)
-	}
-
-	workingDirectoryAbs, err := filepath.Abs(workingDirectory)
+	workingDirectoryAbs, err := resolveDir(workingDirectory)
 	if err != nil {
-		return nil, fmt.Errorf("could not resolve path %s: %w", workingDirectory, err)
+		return nil, err
 	}
 
 	return &VMConfig{
@@ -3,7 +3,6 @@ package ip_discovery
 import (
 	"fmt"
 	"os"
-	"regexp"
 	"strings"
 	"sync"
 	"time"
@@ -11,8 +10,6 @@ import (
 
 const dhcpdLeasesFilePath = "/var/db/dhcpd_leases"
 
-var leadingZeroRegexp = regexp.MustCompile(`0([A-Fa-f0-9](:|$))`)
-
 type dhcpEntry struct {
 	hwAddress  string
 	identifier string
@@ -22,8 +19,9 @@ type dhcpEntry struct {
 }
 
 type IPDiscovery struct {
-	cachedEntries []dhcpEntry
+	cachedIPByMAC map[string]string
 	cachedMtime   time.Time
+	cachedSize    int64
 	leasesFile    string
 	macAddress    string
 	mu            sync.Mutex
@@ -40,9 +38,17 @@ func NewIPDiscovery(macAddress string, leasesFile string) *IPDiscovery {
 	}
 }
 
+// normalizeMac lowercases a MAC address and drops the leading zero from each
+// octet, matching the format used in the dhcpd leases file.
 func normalizeMac(mac string) string {
-	lower := strings.ToLower(mac)
-	return leadingZeroRegexp.ReplaceAllString(lower, "$1")
+	parts := strings.Split(strings.ToLower(mac), ":")
+	for i, part := range parts {
+		if len(part) == 2 && part[0] == '0' {
+			parts[i] = part[1:]
+		}
+	}
+
+	return strings.Join(parts, ":")
 }
 
 func parseDHCPLeases(content string) []dhcpEntry {
@@ -65,13 +71,14 @@ func parseDHCPLeases(content string) []dhcpEntry {
 		if currentEntry == nil {
 			continue
 		}
-		if !strings.Contains(line, "=") {
+
+		rawKey, rawValue, found := strings.Cut(line, "=")
+		if !found {
 			continue
 		}
 
-		kv := strings.SplitN(line, "=", 2)
-		key := strings.TrimSpace(kv[0])
-		value := strings.TrimSpace(kv[1])
+		key := strings.TrimSpace(rawKey)
+		value := strings.TrimSpace(rawValue)
 
 		switch key {
 		case "name":
@@ -105,24 +112,28 @@ func (d *IPDiscovery) DiscoverIP() (string, error) {
 	}
 
 	currentMtime := info.ModTime()
-	var entries []dhcpEntry
-	if !d.cachedMtime.IsZero() && currentMtime.Equal(d.cachedMtime) {
-		entries = d.cachedEntries
-	} else {
+	currentSize := info.Size()
+	ipByMAC := d.cachedIPByMAC
+	if d.cachedMtime.IsZero() || !currentMtime.Equal(d.cachedMtime) || currentSize != d.cachedSize {
 		content, err := os.ReadFile(d.leasesFile)
 		if err != nil {
 			return "", fmt.Errorf("could not read file: %w", err)
 		}
-		entries = parseDHCPLeases(string(content))
-		d.cachedEntries = entries
-		d.cachedMtime = currentMtime
-	}
 
-	for _, entry := range entries {
-		if entry.hwAddress == d.macAddress {
-			return entry.ipAddress, nil
+		entries := parseDHCPLeases(string(content))
+		ipByMAC = make(map[string]string, len(entries))
+		for _, entry := range entries {
+			// First entry wins on duplicate hardware addresses, matching the
+			// previous linear scan.
+			if _, ok := ipByMAC[entry.hwAddress]; !ok {
+				ipByMAC[entry.hwAddress] = entry.ipAddress
+			}
 		}
+
+		d.cachedIPByMAC = ipByMAC
+		d.cachedMtime = currentMtime
+		d.cachedSize = currentSize
 	}
 
-	return "", nil
+	return ipByMAC[d.macAddress], nil
 }
@@ -1,7 +1,6 @@
 package runner
 
 import (
-	"context"
 	"fmt"
 	"io"
 	"log/slog"
@@ -15,17 +14,36 @@ import (
 	"vm-runner/internal/vm_process"
 )
 
+// proxyBufferSize is the per-direction copy buffer for proxied connections;
+// 64 KiB amortizes read/write round-trips on bulk SSH transfers.
+const proxyBufferSize = 64 * 1024
+
+// socketBufferSize matches the 256 KiB buffers used for the vmnet-helper
+// socketpair, keeping bulk transfers from being clamped by the default
+// kernel socket buffers.
+const socketBufferSize = 256 * 1024
+
+func setSocketBuffers(conn net.Conn) {
+	if tc, ok := conn.(*net.TCPConn); ok {
+		tc.SetReadBuffer(socketBufferSize)
+		tc.SetWriteBuffer(socketBufferSize)
+	}
+}
+
 type Runner struct {
-	activationSocket    net.Listener
-	activeConnections   atomic.Int32
-	config              *config.VMConfig
-	lastConnectionTime  time.Time
-	mu                  sync.Mutex
-	shutdownRequested   atomic.Bool
-	shutdownTimerCancel context.CancelFunc
-	signalManager       *signal_manager.SignalManager
-	socketActivation    *socket_activation.SocketActivation
-	vmProcess           *vm_process.VMProcess
+	activationSocket  net.Listener
+	activeConnections atomic.Int32
+	config            *config.VMConfig
+	ensureMu          sync.Mutex
+	mu                sync.Mutex
+	shutdownRequested atomic.Bool
+	shutdownTimer     *time.Timer
+	signalManager     *signal_manager.SignalManager
+	socketActivation  *socket_activation.SocketActivation
+	vmAddr            *net.TCPAddr
+	vmAddrIP          string
+	vmProcess         *vm_process.VMProcess
+	vmReady           atomic.Bool
 }
 
 func NewRunner(config *config.VMConfig, signalManager *signal_manager.SignalManager) *Runner {
@@ -38,6 +56,22 @@ func NewRunner(config *config.VMConfig, signalManager *signal_manager.SignalMana
 }
 
 func (r *Runner) ensureVMReady() error {
+	// Fast path: a previous connection already brought the VM up and nothing
+	// has paused or stopped it since, so skip the driver API round-trip.
+	if r.vmReady.Load() && r.vmProcess.IsRunning() {
+		return nil
+	}
+
+	// Serialize the slow path so a burst of connections against a cold VM
+	// results in one start attempt; the rest take the fast path above once
+	// the first caller finishes.
+	r.ensureMu.Lock()
+	defer r.ensureMu.Unlock()
+
+	if r.vmReady.Load() && r.vmProcess.IsRunning() {
+		return nil
+	}
+
 	if r.signalManager.IsShutdownRequested() {
 		return fmt.Errorf("shutdown requested, not starting VM")
 	}
@@ -52,55 +86,83 @@ func (r *Runner) ensureVMReady() error {
 		}
 	}
 
+	r.vmReady.Store(true)
 	return nil
 }
 
-func (r *Runner) scheduleShutdownCheck(ctx context.Context) error {
+// vmTCPAddr returns the resolved VM SSH endpoint, re-parsing the IP only
+// when discovery hands back a different address after a VM restart.
+func (r *Runner) vmTCPAddr() (*net.TCPAddr, error) {
+	ip := r.vmProcess.IPAddress()
+
+	r.mu.Lock()
+	defer r.mu.Unlock()
+
+	if r.vmAddr == nil || r.vmAddrIP != ip {
+		parsed := net.ParseIP(ip)
+		if parsed == nil {
+			return nil, fmt.Errorf("invalid VM IP address: %q", ip)
+		}
+		r.vmAddr = &net.TCPAddr{IP: parsed, Port: 22}
+		r.vmAddrIP = ip
+	}
+
+	return r.vmAddr, nil
+}
+
+// idleShutdownCheck fires when the idle TTL elapses; it pauses or stops the
+// VM unless a connection arrived or shutdown began in the meantime.
+func (r *Runner) idleShutdownCheck() {
+	if r.shutdownRequested.Load() || r.activeConnections.Load() != 0 {
+		return
+	}
+
+	r.vmReady.Store(false)
+	if r.config.OnDemand {
+		if err := r.vmProcess.PauseOrStop(); err != nil {
+			slog.Error("failed to pause or stop idle VM", "error", err)
+		}
+	} else {
+		r.vmProcess.Stop(30 * time.Second)
+	}
+}
+
+// armShutdownTimer (re)starts the idle TTL countdown on a single reused
+// timer rather than spawning a goroutine per idle transition.
+func (r *Runner) armShutdownTimer() {
 	ttl := time.Duration(r.config.TTL) * time.Second
-	timer := time.NewTimer(ttl)
-	defer timer.Stop()
+
+	r.mu.Lock()
+	if r.shutdownTimer == nil {
+		r.shutdownTimer = time.AfterFunc(ttl, r.idleShutdownCheck)
+	} else {
+		r.shutdownTimer.Reset(ttl)
+	}
+	r.mu.Unlock()
 
 	slog.Info("scheduled shutdown check", slog.Int("seconds", r.config.TTL))
+}
 
-	select {
-	case <-timer.C:
-		if r.activeConnections.Load() == 0 {
-			if r.config.OnDemand {
-				if err := r.vmProcess.PauseOrStop(); err != nil {
-					return err
-				}
-			} else {
-				r.vmProcess.Stop(30 * time.Second)
-			}
-		}
-		return nil
-	case <-ctx.Done():
-		return nil
+func (r *Runner) stopShutdownTimer() {
+	r.mu.Lock()
+	if r.shutdownTimer != nil {
+		r.shutdownTimer.Stop()
 	}
+	r.mu.Unlock()
 }
 
 func (r *Runner) proxyConnection(clientConn net.Conn) {
 	active := r.activeConnections.Add(1)
 	slog.Info("new connection", slog.Int("active_connections", int(active)))
 
-	r.mu.Lock()
-	r.lastConnectionTime = time.Now()
-	if r.shutdownTimerCancel != nil {
-		r.shutdownTimerCancel()
-		r.shutdownTimerCancel = nil
-	}
-	r.mu.Unlock()
+	r.stopShutdownTimer()
 
 	defer func() {
 		active = r.activeConnections.Add(-1)
 		clientConn.Close()
 		slog.Info("connection closed", slog.Int("active_connections", int(active)))
-		if r.config.OnDemand {
-			ctx, cancelCtx := context.WithCancel(context.Background())
-			r.mu.Lock()
-			r.shutdownTimerCancel = cancelCtx
-			r.mu.Unlock()
-			go r.scheduleShutdownCheck(ctx)
+		if r.config.OnDemand && active == 0 {
+			r.armShutdownTimer()
 		}
 	}()
 
@@ -114,19 +176,31 @@ func (r *Runner) proxyConnection(clientConn net.Conn) {
 		return
 	}
 
-	hostPort := net.JoinHostPort(r.vmProcess.IPAddress(), "22")
-	vmConn, err := net.Dial("tcp", hostPort)
+	vmAddr, err := r.vmTCPAddr()
+	if err != nil {
+		slog.Error("failed to connect to VM", "error", err)
+		return
+	}
+
+	vmConn, err := net.DialTCP("tcp", nil, vmAddr)
 	if err != nil {
 		slog.Error("failed to connect to VM", "error", err)
 		return
 	}
 
+	setSocketBuffers(clientConn)
+	setSocketBuffers(vmConn)
+
 	var wg sync.WaitGroup
 	wg.Add(2)
 
+	// Both ends are wrapped so io.CopyBuffer sees neither WriterTo nor
+	// ReaderFrom and actually uses the enlarged buffer; TCPConn's fast paths
+	// would otherwise take over with their own 32 KiB loop, since Darwin has
+	// no socket-to-socket zero-copy for them to splice with.
 	go func() {
 		defer wg.Done()
-		io.Copy(clientConn, vmConn)
+		io.CopyBuffer(struct{ io.Writer }{clientConn}, struct{ io.Reader }{vmConn}, make([]byte, proxyBufferSize))
 		if c, ok := clientConn.(interface{ CloseWrite() error }); ok {
 			c.CloseWrite()
 		}
@@ -134,7 +208,7 @@ func (r *Runner) proxyConnection(clientConn net.Conn) {
 
 	go func() {
 		defer wg.Done()
-		io.Copy(vmConn, clientConn)
+		io.CopyBuffer(struct{ io.Writer }{vmConn}, struct{ io.Reader }{clientConn}, make([]byte, proxyBufferSize))
 		if c, ok := vmConn.(interface{ CloseWrite() error }); ok {
 			c.CloseWrite()
 		}
@@ -188,12 +262,7 @@ func (r *Runner) Run() error {
 
 	defer func() {
 		r.shutdownRequested.Store(true)
-		r.mu.Lock()
-		if r.shutdownTimerCancel != nil {
-			r.shutdownTimerCancel()
-			r.shutdownTimerCancel = nil
-		}
-		r.mu.Unlock()
+		r.stopShutdownTimer()
 	}()
 
 	select {
@@ -9,6 +9,7 @@ import (
 	"fmt"
 	"net"
 	"os"
+	"strconv"
 	"syscall"
 	"unsafe"
 )
@@ -60,34 +61,68 @@ func (a *SocketActivation) inspectSocketFD(fd int) (net.Listener, error) {
 	return ln, nil
 }
 
-func (a *SocketActivation) listenerMatchesPort(ln net.Listener) bool {
-	addr, ok := ln.Addr().(*net.TCPAddr)
-	if !ok {
+// fdMatchesPort reports whether fd is a TCP socket bound to the expected
+// port, using getsockname directly so non-matching descriptors are skipped
+// without being duplicated into listeners first.
+func (a *SocketActivation) fdMatchesPort(fd int) bool {
+	sa, err := syscall.Getsockname(fd)
+	if err != nil {
 		return false
 	}
 
-	return addr.Port == a.port
+	switch addr := sa.(type) {
+	case *syscall.SockaddrInet4:
+		return addr.Port == a.port
+	case *syscall.SockaddrInet6:
+		return addr.Port == a.port
+	}
+
+	return false
 }
 
 func (a *SocketActivation) processLaunchdSockets(fds []int) (net.Listener, error) {
 	for _, fd := range fds {
+		if !a.fdMatchesPort(fd) {
+			continue
+		}
+
 		ln, err := a.inspectSocketFD(fd)
 		if err != nil {
 			continue
 		}
 
-		if a.listenerMatchesPort(ln) {
-			return ln, nil
+		return ln, nil
+	}
+
+	return nil, fmt.Errorf("no activation socket found on port %d", a.port)
+}
+
+// openFDs enumerates the process's open file descriptors via /dev/fd,
+// falling back to a fixed range when the directory cannot be read.
+func openFDs() []int {
+	entries, err := os.ReadDir("/dev/fd")
+	if err != nil {
+		fds := make([]int, 0, 253)
+		for fd := 3; fd < 256; fd++ {
+			fds = append(fds, fd)
 		}
+		return fds
+	}
 
-		ln.Close()
+	fds := make([]int, 0, len(entries))
+	for _, entry := range entries {
+		fd, err := strconv.Atoi(entry.Name())
+		if err != nil || fd < 3 {
+			continue
+		}
+		fds = append(fds, fd)
 	}
 
-	return nil, fmt.Errorf("no activation socket found on port %d", a.port)
+	return fds
 }
 
 func (a *SocketActivation) fallbackSocketScan() (net.Listener, error) {
-	for fd := 3; fd < 256; fd++ {
+	for _, fd := range openFDs() {
 		var st syscall.Stat_t
 
 		if err := syscall.Fstat(fd, &st); err != nil {
@@ -96,17 +131,16 @@ func (a *SocketActivation) fallbackSocketScan() (net.Listener, error) {
 		if st.Mode&syscall.S_IFSOCK == 0 {
 			continue
 		}
+		if !a.fdMatchesPort(fd) {
+			continue
+		}
 
 		ln, err := a.inspectSocketFD(fd)
 		if err != nil {
 			continue
 		}
 
-		if a.listenerMatchesPort(ln) {
-			return ln, nil
-		}
-
-		ln.Close()
+		return ln, nil
 	}
 
 	return nil, fmt.Errorf("no activation socket found on port %d", a.port)
@@ -5,6 +5,7 @@ import (
 	"net"
 	"os"
 	"path/filepath"
+	"sync"
 	"time"
 
 	"golang.org/x/crypto/ssh"
@@ -12,7 +13,10 @@ import (
 )
 
 type SSHConnectivityTester struct {
+	hostKeyCallback    ssh.HostKeyCallback
 	knownHostsFilePath string
+	mu                 sync.Mutex
+	signer             ssh.Signer
 	sshKeyPath         string
 	username           string
 }
@@ -25,28 +29,44 @@ func NewSSHConnectivityTester(workingDirectory string) *SSHConnectivityTester {
 	}
 }
 
-func (t *SSHConnectivityTester) TestConnectivity(ipAddress string, timeout int) (bool, error) {
-	_, err := os.Stat(t.sshKeyPath)
-	if err != nil {
-		if os.IsNotExist(err) {
-			return false, fmt.Errorf("file does not exist: %w", err)
-		}
-		return false, err
+// loadCredentials reads and parses the private key and known-hosts file on
+// the first call and reuses the parsed results for every later probe.
+func (t *SSHConnectivityTester) loadCredentials() (ssh.Signer, ssh.HostKeyCallback, error) {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+
+	if t.signer != nil && t.hostKeyCallback != nil {
+		return t.signer, t.hostKeyCallback, nil
 	}
 
 	keyBytes, err := os.ReadFile(t.sshKeyPath)
 	if err != nil {
-		return false, fmt.Errorf("failed to read private key: %w", err)
+		if os.IsNotExist(err) {
+			return nil, nil, fmt.Errorf("file does not exist: %w", err)
+		}
+		return nil, nil, fmt.Errorf("failed to read private key: %w", err)
 	}
 
 	signer, err := ssh.ParsePrivateKey(keyBytes)
 	if err != nil {
-		return false, fmt.Errorf("failed to parse private key: %w", err)
+		return nil, nil, fmt.Errorf("failed to parse private key: %w", err)
 	}
 
 	hostKeyCallback, err := knownhosts.New(t.knownHostsFilePath)
 	if err != nil {
-		return false, fmt.Errorf("failed to load known hosts file: %w", err)
+		return nil, nil, fmt.Errorf("failed to load known hosts file: %w", err)
+	}
+
+	t.signer = signer
+	t.hostKeyCallback = hostKeyCallback
+
+	return signer, hostKeyCallback, nil
+}
+
+func (t *SSHConnectivityTester) TestConnectivity(ipAddress string, timeout int) (bool, error) {
+	signer, hostKeyCallback, err := t.loadCredentials()
+	if err != nil {
+		return false, err
 	}
 
 	wrappedHostKeyCallback := func(hostname string, remote net.Addr, key ssh.PublicKey) error {
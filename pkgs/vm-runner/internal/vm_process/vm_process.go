@@ -8,6 +8,7 @@ import (
 	"io"
 	"log/slog"
 	mrand "math/rand/v2"
+	"net"
 	"os"
 	"os/exec"
 	"path/filepath"
@@ -34,12 +35,19 @@ const (
 	VMProcessStateUnknown VMProcessState = "unknown"
 )
 
+var vmProcessStateByAPIState = map[string]VMProcessState{
+	string(api.VMStateRunning): VMProcessStateRunning,
+	string(api.VMStatePaused):  VMProcessStatePaused,
+	string(api.VMStateStopped): VMProcessStateStopped,
+}
+
 type VMProcess struct {
 	apiClient         *api.APIClient
 	apiPort           int
 	circuitBreaker    *circuit_breaker.CircuitBreaker
 	command           *exec.Cmd
 	config            *config.VMConfig
+	driverCommand     []string
 	ipAddress         string
 	ipDiscovery       *ip_discovery.IPDiscovery
 	macAddress        string
@@ -54,10 +62,8 @@ type VMProcess struct {
 func generateMacAddress() string {
 	b := make([]byte, 4)
 	crand.Read(b)
-	prefix := "02:94"
-	suffix := fmt.Sprintf("%02x:%02x:%02x:%02x", b[0], b[1], b[2], b[3])
 
-	return fmt.Sprintf("%s:%s", prefix, suffix)
+	return fmt.Sprintf("02:94:%02x:%02x:%02x:%02x", b[0], b[1], b[2], b[3])
 }
 
 func consumeVMProcessOutput(stdout, stderr io.ReadCloser, ch chan struct{}) {
@@ -68,11 +74,14 @@ func consumeVMProcessOutput(stdout, stderr io.ReadCloser, ch chan struct{}) {
 	readStream := func(stream io.ReadCloser) {
 		defer wg.Done()
 		sc := bufio.NewScanner(stream)
+		sc.Buffer(make([]byte, 0, 64*1024), 256*1024)
 		for sc.Scan() {
 			slog.Debug(sc.Text())
 		}
 		if err := sc.Err(); err != nil {
 			slog.Error("failed to read stream", "error", err)
+			// Keep draining so the driver never blocks on a full pipe.
+			io.Copy(io.Discard, stream)
 		}
 	}
 
@@ -117,6 +126,15 @@ func (vp *VMProcess) IPAddress() string {
 }
 
 func (vp *VMProcess) buildDriverCommand() ([]string, error) {
+	// The command is fully determined by the config and the MAC address, both
+	// fixed at construction, so build it once and reuse it across restarts.
+	vp.mu.Lock()
+	cached := vp.driverCommand
+	vp.mu.Unlock()
+	if cached != nil {
+		return cached, nil
+	}
+
 	diffDiskPath := filepath.Join(vp.config.WorkingDirectory, diffDiskFileName)
 	efiStorePath := filepath.Join(vp.config.WorkingDirectory, efiVariableStoreFileName)
 	serialLogFilePath := "/dev/null"
@@ -170,6 +188,10 @@ func (vp *VMProcess) buildDriverCommand() ([]string, error) {
 		cmd = append(cmd, "--device", fmt.Sprintf("virtio-fs,sharedDir=%s,mountTag=%s", path, tag))
 	}
 
+	vp.mu.Lock()
+	vp.driverCommand = cmd
+	vp.mu.Unlock()
+
 	return cmd, nil
 }
 
@@ -233,13 +255,8 @@ func (vp *VMProcess) GetCurrentState() VMProcessState {
 		return VMProcessStateUnknown
 	}
 
-	switch state {
-	case string(api.VMStateRunning):
-		return VMProcessStateRunning
-	case string(api.VMStatePaused):
-		return VMProcessStatePaused
-	case string(api.VMStateStopped):
-		return VMProcessStateStopped
+	if mapped, ok := vmProcessStateByAPIState[state]; ok {
+		return mapped
 	}
 
 	return VMProcessStateUnknown
@@ -348,6 +365,10 @@ func (vp *VMProcess) startVMProcess() error {
 	cmd := exec.Command(driverCommand[0], driverCommand[1:]...)
 	cmd.Dir = vp.config.WorkingDirectory
 
+	// Run the driver in its own session so signals aimed at the runner don't
+	// reach it directly; shutdown is driven explicitly by Stop.
+	cmd.SysProcAttr = &syscall.SysProcAttr{Setsid: true}
+
 	var stdout, stderr io.ReadCloser
 	if vp.config.Debug {
 		var err error
@@ -501,32 +522,40 @@ func (vp *VMProcess) getIPAddress() (string, error) {
 		}
 
 		time.Sleep(interval)
-		interval = min(interval*2, maxInterval)
+		interval = min(interval*3/2, maxInterval)
 	}
 
 	return "", fmt.Errorf("failed to discover IP address: timeout exceeded")
 }
 
 func (vp *VMProcess) waitForSSH(ipAddress string, tester *ssh.SSHConnectivityTester) error {
-	increment := 125 * time.Millisecond
-	interval := 500 * time.Millisecond
-	maxInterval := 1 * time.Second
+	interval := 100 * time.Millisecond
+	maxInterval := 2 * time.Second
 
 	slog.Info("waiting for SSH connectivity to VM")
 
+	sshAddr := net.JoinHostPort(ipAddress, "22")
+
 	startTime := time.Now()
 	for time.Since(startTime) < sshReadyTimeout {
-		ok, err := tester.TestConnectivity(ipAddress, 5)
-		if err != nil {
-			return fmt.Errorf("SSH connectivity test failed: %w", err)
+		// A plain TCP dial is much cheaper than a full SSH handshake; until
+		// the guest's sshd is listening, skip the probe and keep backing off.
+		if conn, err := net.DialTimeout("tcp", sshAddr, 1*time.Second); err == nil {
+			conn.Close()
+
+			ok, err := tester.TestConnectivity(ipAddress, 5)
+			if err != nil {
+				return fmt.Errorf("SSH connectivity test failed: %w", err)
+			}
+
+			if ok {
+				return nil
+			}
 		}
 
-		if ok {
-			return nil
-		}
-
-		time.Sleep(interval)
-		interval = min(interval+increment, maxInterval)
+		jitter := time.Duration(mrand.Int64N(int64(interval / 4)))
+		time.Sleep(interval + jitter)
+		interval = min(interval*17/10, maxInterval)
 	}
 
 	return fmt.Errorf("SSH connectivity test failed: timeout exceeded")
@@ -538,7 +567,7 @@ func (vp *VMProcess) Start() error {
 	vp.shutdownRequested.Store(false)
 
 	if err := vp.killOrphanedDriverProcesses(); err != nil {
-		slog.Error(fmt.Sprintf("failed to kill orphaned %s process", vp.config.Driver), "error", err)
+		slog.Error("failed to kill orphaned driver process", "driver", vp.config.Driver, "error", err)
 	}
 	if err := vp.startVMProcess(); err != nil {
 		return err
@@ -573,14 +602,17 @@ func (vp *VMProcess) Stop(timeout time.Duration) {
 	vp.mu.Unlock()
 
 	if cmd != nil && exitCh != nil {
-		cmd.Process.Signal(syscall.SIGTERM)
+		// Setsid makes the driver its own group leader (pgid == pid), so a
+		// negative-pid kill reaches the driver and anything it forked with a
+		// single syscall.
+		syscall.Kill(-cmd.Process.Pid, syscall.SIGTERM)
 
 		select {
 		case <-exitCh:
 			slog.Info("VM stopped gracefully")
 		case <-time.After(timeout):
 			slog.Info("unable to stop VM gracefully, killing process instead", "reason", "timeout exceeded")
-			cmd.Process.Kill()
+			syscall.Kill(-cmd.Process.Pid, syscall.SIGKILL)
 			<-exitCh
 		}
 